@@ -3,22 +3,15 @@ import logging
 from dotenv import load_dotenv
 from livekit.agents import (
     Agent,
-    AgentSession,
-    JobContext,
-    JobProcess,
-    MetricsCollectedEvent,
-    RoomInputOptions,
     WorkerOptions,
     cli,
-    metrics,
-    tokenize,
 )
-from livekit.plugins import murf, silero, google, deepgram, noise_cancellation
-from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
+from agent_runtime import build_entrypoint, prewarm
 from tools.wellness_tools import (
-    log_wellness_entry,
+    flush_wellness_log,
     get_last_wellness_entry,
+    log_wellness_entry,
 )
 
 logger = logging.getLogger("agent")
@@ -26,11 +19,8 @@ logger = logging.getLogger("agent")
 load_dotenv(".env.local")
 
 
-class Assistant(Agent):
-    def __init__(self) -> None:
-        # System prompt for health & wellness companion
-        super().__init__(
-            instructions="""
+# System prompt for health & wellness companion
+_SYSTEM_PROMPT = """
 You are a calm, supportive, and grounded health & wellness voice companion.
 You are NOT a doctor, therapist, or clinician. Never diagnose, never mention disorders,
 and never give medical advice. Stay practical, gentle, and non-judgmental.
@@ -50,7 +40,7 @@ You have access to two tools:
 
 2) log_wellness_entry(mood, energy, stressors, objectives, summary)
    - Use this at the END of the check-in, after you recap and confirm the details.
-   - This stores the check-in in wellness_log.json for future sessions.
+   - This stores the check-in in wellness_log.jsonl for future sessions.
 
 Conversation flow (very important):
 
@@ -99,63 +89,27 @@ Conversation flow (very important):
 
 Be warm, concise, and supportive. Avoid long speeches.
 Always stay within your role as a non-medical companion.
-""",
+"""
+
+
+class Assistant(Agent):
+    def __init__(self) -> None:
+        super().__init__(
+            instructions=_SYSTEM_PROMPT,
         )
 
 
-def prewarm(proc: JobProcess):
-    proc.userdata["vad"] = silero.VAD.load()
-
-
-async def entrypoint(ctx: JobContext):
-    # Attach room name to logs
-    ctx.log_context_fields = {"room": ctx.room.name}
-
-    # Voice AI pipeline: Deepgram STT, Gemini LLM, Murf TTS
-    session = AgentSession(
-        stt=deepgram.STT(model="nova-3"),
-        llm=google.LLM(model="gemini-2.5-flash"),
-        tts=murf.TTS(
-            voice="en-US-matthew",
-            style="Conversation",
-            tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
-            text_pacing=True,
-        ),
-        turn_detection=MultilingualModel(),
-        vad=ctx.proc.userdata["vad"],
-        preemptive_generation=True,
-        # 🔧 Tools available to the LLM
-        tools=[
-            get_last_wellness_entry,
-            log_wellness_entry,
-        ],
-    )
-
-    # Metrics collection
-    usage_collector = metrics.UsageCollector()
-
-    @session.on("metrics_collected")
-    def _on_metrics_collected(ev: MetricsCollectedEvent):
-        metrics.log_metrics(ev.metrics)
-        usage_collector.collect(ev.metrics)
-
-    async def log_usage():
-        summary = usage_collector.get_summary()
-        logger.info(f"Usage: {summary}")
-
-    ctx.add_shutdown_callback(log_usage)
-
-    # Start the session (agent + room)
-    await session.start(
-        agent=Assistant(),
-        room=ctx.room,
-        room_input_options=RoomInputOptions(
-            noise_cancellation=noise_cancellation.BVC(),
-        ),
-    )
-
-    # Join the room and connect to the user
-    await ctx.connect()
+# Shared pipeline (Deepgram STT, Gemini LLM, Murf TTS) from agent_runtime
+entrypoint = build_entrypoint(
+    Assistant,
+    # 🔧 Tools available to the LLM
+    [
+        get_last_wellness_entry,
+        log_wellness_entry,
+    ],
+    # Write out check-ins still buffered when the call ends.
+    shutdown_callbacks=[flush_wellness_log],
+)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 # smarter way to print logs with additional information.
 import logging
+import os
 # import env variables from a .env file into the environment.
 from dotenv import load_dotenv
 
@@ -7,30 +8,14 @@ from dotenv import load_dotenv
 # livekit provides a room for agent and human to talk in real time without pressing buttons.
 from livekit.agents import (
     Agent,              # tells the behaviour of the agent.
-    AgentSession,       # connect the agent to the room and manage the conversation, connects tts, stt, llm, vad etc also.
-    JobContext,
-    JobProcess,
-    MetricsCollectedEvent,  # saves info like api calls etc
-    RoomInputOptions,
     WorkerOptions,
     cli,
-    metrics,
-    tokenize,
 )
 
-from livekit.plugins import silero, google, deepgram, noise_cancellation
-from livekit.plugins import murf
-from livekit.plugins.turn_detector.multilingual import MultilingualModel
-
+from agent_runtime import STT_ACCURATE, build_entrypoint, prewarm
+from tools.catalog_tools import ingredients_for, lookup_items  # Catalog / recipe lookups
 from tools.orderTool import save_order_to_json  # Tool that writes final order to JSON
 
-# --------------------------------------------------------------------
-# Logging setup – smarter, structured logs
-# --------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
 logger = logging.getLogger("agent")
 
 # load environment variables from the .env.local file.
@@ -40,44 +25,22 @@ load_dotenv(".env.local")
 # --------------------------------------------------------------------
 # Grocery / Food Ordering Assistant
 # --------------------------------------------------------------------
-class GroceryAssistant(Agent):
-    def __init__(self) -> None:
-        """
-        Day 7 – Food & Grocery Ordering Voice Agent
-
-        This agent:
-        - Helps the user order groceries and simple food items.
-        - Maintains a cart object in its "mind" as the conversation goes.
-        - Supports "ingredients for X" style requests using a small recipe mapping.
-        - When the user is done, saves the final order to JSON via the save_order_to_json tool.
-        """
-        super().__init__(
-            instructions='''
+_SYSTEM_PROMPT = '''
 You are a friendly food & grocery ordering assistant for a fictional Indian store called **QuickBasket**.
 You talk to the user over voice and help them build a grocery & food order.
 
 -------------------------
-CATALOG (reference only)
+CATALOG TOOLS
 -------------------------
-Assume the store has at least the following items available:
-
-[
-  { "name": "whole wheat bread",    "category": "groceries", "price": 50,  "tags": ["bread", "vegetarian"] },
-  { "name": "white bread",          "category": "groceries", "price": 45,  "tags": ["bread", "vegetarian"] },
-  { "name": "peanut butter",        "category": "groceries", "price": 180, "tags": ["spread", "vegetarian"] },
-  { "name": "mixed fruit jam",      "category": "groceries", "price": 120, "tags": ["spread", "vegetarian"] },
-  { "name": "eggs (6 pack)",        "category": "groceries", "price": 60,  "tags": ["eggs"] },
-  { "name": "milk 1L",              "category": "groceries", "price": 70,  "tags": ["dairy"] },
-  { "name": "pasta 500g",           "category": "groceries", "price": 90,  "tags": ["pasta", "vegetarian"] },
-  { "name": "pasta sauce jar",      "category": "groceries", "price": 150, "tags": ["sauce", "vegetarian"] },
-  { "name": "processed cheese 200g","category": "groceries", "price": 110, "tags": ["cheese", "dairy"] },
-  { "name": "potato chips",         "category": "snacks",    "price": 40,  "tags": ["snack", "vegetarian"] },
-  { "name": "chocolate cookies",    "category": "snacks",    "price": 60,  "tags": ["snack", "vegetarian"] },
-  { "name": "ready-to-eat veg pulao","category": "prepared", "price": 120, "tags": ["prepared", "vegetarian"] }
-]
-
-You DON'T need to read any file; this catalog is given to you in the system prompt.
-Use exact or very close item names from the catalog when you build the order.
+The store catalog is NOT in this prompt. Look items up with the tools:
+
+- lookup_items(query): returns up to 5 matching catalog items with name,
+  category, price (INR) and tags. An empty list means the store doesn't stock it.
+- ingredients_for(dish): returns the catalog items needed for a simple dish
+  (e.g. "peanut butter sandwich", "jam toast", "pasta"), with hints such as
+  alternatives, optional items and quantity notes. Empty means the dish is unknown.
+
+Always use the exact item names and prices returned by these tools when you build the order.
 
 -------------------------
 CART STRUCTURE
@@ -91,7 +54,7 @@ cart = {
       "category": "string",
       "quantity": 1,               # integer
       "unit": "pack / piece / jar / loaf / litre / gram etc.",
-      "pricePerUnit": 0,           # number (use the catalog prices above)
+      "pricePerUnit": 0,           # number (use the price returned by lookup_items)
       "totalPrice": 0,             # quantity * pricePerUnit
       "notes": "string or empty"   # e.g. "whole wheat preferred"
     }
@@ -156,20 +119,10 @@ BEHAVIOUR & FLOW
    - Handle higher-level requests like:
        - "I need ingredients for a peanut butter sandwich."
        - "Get me what I need for pasta for two people."
-   - Use a small internal mapping:
-
-     - "peanut butter sandwich" ->
-         - whole wheat bread
-         - peanut butter
-
-     - "jam toast" ->
-         - whole wheat bread OR white bread
-         - mixed fruit jam
-
-     - "pasta for N people" ->
-         - pasta 500g (roughly 1 pack for 2 people)
-         - pasta sauce jar
-         - processed cheese 200g (optional, ask user if they want cheese)
+   - Call ingredients_for(dish) to get the items for the dish.
+     - Respect its hints: offer the alternatives, ask before adding optional items
+       (e.g. cheese for pasta), and scale quantities using the notes
+       (e.g. roughly 1 pack of pasta 500g for 2 people).
 
    - Add ALL selected items to the cart and then confirm verbally:
        - "For peanut butter sandwiches, I’ve added one loaf of whole wheat bread and one jar of peanut butter."
@@ -181,7 +134,7 @@ BEHAVIOUR & FLOW
        - "Would you like whole wheat bread or white bread? And how many loaves?"
 
 5. CART TOTAL
-   - Use the prices from the catalog.
+   - Use the prices returned by lookup_items / ingredients_for.
    - Whenever the user asks or when the cart changes significantly, mention an approximate total:
        - "Your cart total is currently about 620 rupees."
 
@@ -214,67 +167,42 @@ STYLE
 - NEVER talk about JSON files, tools, or function calls explicitly unless the user is a developer and directly asks.
 - By default, assume the user is a regular customer.
 '''
-        )
-
 
-# before starting the agent, load the VAD (Voice Activity Detection) model into userdata.
-def prewarm(proc: JobProcess):
-    logger.info("Prewarming process: loading VAD model...")
-    proc.userdata["vad"] = silero.VAD.load()
-    logger.info("VAD model loaded and stored in proc.userdata['vad'].")
 
+class GroceryAssistant(Agent):
+    def __init__(self) -> None:
+        """
+        Day 7 – Food & Grocery Ordering Voice Agent
 
-# create the entrypoint function where the agent session is created and started.
-async def entrypoint(ctx: JobContext):
-    # This context field is used by LiveKit logging integrations
-    ctx.log_context_fields = {"room": ctx.room.name}
-
-    logger.info(f"Starting GroceryAssistant session for room: {ctx.room.name}")
-
-    # Create AgentSession and attach tools here
-    session = AgentSession(
-        stt=deepgram.STT(model="nova-3"),
-        llm=google.LLM(model="gemini-2.5-flash"),
-        tts=murf.TTS(
-            voice="en-US-matthew",
-            style="Conversation",
-            tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
-            text_pacing=True,
-        ),
-        turn_detection=MultilingualModel(),
-        vad=ctx.proc.userdata["vad"],
-        preemptive_generation=True,
-        tools=[save_order_to_json],  # ✅ Tool for saving the final order as JSON
-    )
-
-    # Metrics collection
-    usage_collector = metrics.UsageCollector()
-
-    @session.on("metrics_collected")
-    def _on_metrics_collected(ev: MetricsCollectedEvent):
-        metrics.log_metrics(ev.metrics)
-        usage_collector.collect(ev.metrics)
-
-    async def log_usage():
-        summary = usage_collector.get_summary()
-        logger.info(f"Usage summary: {summary}")
-
-    ctx.add_shutdown_callback(log_usage)
+        This agent:
+        - Helps the user order groceries and simple food items.
+        - Maintains a cart object in its "mind" as the conversation goes.
+        - Supports "ingredients for X" style requests via the ingredients_for tool.
+        - When the user is done, saves the final order to JSON via the save_order_to_json tool.
+        """
+        super().__init__(
+            instructions=_SYSTEM_PROMPT
+        )
 
-    # Start agent
-    await session.start(
-        agent=GroceryAssistant(),
-        room=ctx.room,
-        room_input_options=RoomInputOptions(
-            noise_cancellation=noise_cancellation.BVC(),
-        ),
-    )
 
-    # Connect to the room
-    await ctx.connect()
-    logger.info(f"Agent connected to room: {ctx.room.name}")
+# create the entrypoint function where the agent session is created and started.
+entrypoint = build_entrypoint(
+    GroceryAssistant,
+    [
+        lookup_items,
+        ingredients_for,
+        save_order_to_json,  # ✅ Tool for saving the final order as JSON
+    ],
+    stt_options=STT_ACCURATE,  # prices and quantities must be heard exactly
+)
 
 
 if __name__ == "__main__":
+    # Logging setup – smarter, structured logs. Configured here rather than at
+    # import time so importing this module doesn't override the host's handlers.
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "INFO"),
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
     logger.info("Starting LiveKit worker for GroceryAssistant...")
     cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
@@ -6,19 +6,11 @@ from dotenv import load_dotenv
 # livekit library imports for building conversational agents.
 from livekit.agents import (
     Agent,          # tells the behaviour of the agent.
-    AgentSession,   # connects the agent to the room and manages the conversation.
-    JobContext,
-    JobProcess,
-    MetricsCollectedEvent,
-    RoomInputOptions,
     WorkerOptions,
     cli,
-    metrics,
-    tokenize,
 )
 
-from livekit.plugins import murf, silero, google, deepgram, noise_cancellation
-from livekit.plugins.turn_detector.multilingual import MultilingualModel
+from agent_runtime import STT_ACCURATE, build_entrypoint, prewarm
 
 # 🔹 NEW: fraud DB tools
 from tools.fraud_db import load_fraud_case, update_fraud_case
@@ -29,10 +21,7 @@ logger = logging.getLogger("agent")
 load_dotenv(".env.local")
 
 
-class FraudAssistant(Agent):
-    def __init__(self) -> None:
-        super().__init__(
-            instructions="""
+_SYSTEM_PROMPT = """
 You are a **calm, professional fraud detection representative** for a fictional bank called
 **Saffron Bank**, and your name is **Ananya**.
 
@@ -174,62 +163,28 @@ When the session starts:
 - NEVER:
   - Ask for card PIN, OTP, full card number, CVV, passwords, or any other credentials.
   - Reveal full card details; only mention the masked card from the database.
-""",
+"""
+
+
+class FraudAssistant(Agent):
+    def __init__(self) -> None:
+        super().__init__(
+            instructions=_SYSTEM_PROMPT,
         )
 
 
-def prewarm(proc: JobProcess):
-    # load the VAD (Voice Activity Detection) model into userdata.
-    proc.userdata["vad"] = silero.VAD.load()
-
-
-async def entrypoint(ctx: JobContext):
-    ctx.log_context_fields = {"room": ctx.room.name}
-
-    # Create AgentSession and attach tools here
-    session = AgentSession(
-        stt=deepgram.STT(model="nova-3"),
-        llm=google.LLM(model="gemini-2.5-flash"),
-        tts=murf.TTS(
-            voice="en-US-matthew",
-            style="Conversation",
-            tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
-            text_pacing=True,
-        ),
-        turn_detection=MultilingualModel(),
-        vad=ctx.proc.userdata["vad"],
-        preemptive_generation=True,
-        tools=[
-            load_fraud_case,
-            update_fraud_case,
-        ],
-    )
-
-    # Metrics collection
-    usage_collector = metrics.UsageCollector()
-
-    @session.on("metrics_collected")
-    def _on_metrics_collected(ev: MetricsCollectedEvent):
-        metrics.log_metrics(ev.metrics)
-        usage_collector.collect(ev.metrics)
-
-    async def log_usage():
-        summary = usage_collector.get_summary()
-        logger.info(f"Usage: {summary}")
-
-    ctx.add_shutdown_callback(log_usage)
-
-    # Start agent
-    await session.start(
-        agent=FraudAssistant(),
-        room=ctx.room,
-        room_input_options=RoomInputOptions(
-            noise_cancellation=noise_cancellation.BVC(),
-        ),
-    )
-
-    # Connect to the room
-    await ctx.connect()
+entrypoint = build_entrypoint(
+    FraudAssistant,
+    [
+        load_fraud_case,
+        update_fraud_case,
+    ],
+    stt_options=STT_ACCURATE,  # amounts and security answers must be heard exactly
+    # One-on-one, English, tightly scripted call: VAD silence plus Deepgram
+    # endpointing already gives clean turn boundaries, so skip the per-utterance
+    # turn-detector inference and answer sooner.
+    use_turn_detector=False,
+)
 
 
 if __name__ == "__main__":
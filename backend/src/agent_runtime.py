@@ -0,0 +1,153 @@
+"""
+agent_runtime.py
+Shared worker wiring for the voice agents: prewarm, the AgentSession pipeline
+(Deepgram STT, Gemini LLM, Murf TTS), metrics collection and room start-up.
+Each agent module only supplies its Agent class, its tools and its TTS voice.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Sequence
+from typing import Callable, Optional
+
+from livekit.agents import (
+    Agent,
+    AgentSession,
+    JobContext,
+    JobProcess,
+    MetricsCollectedEvent,
+    RoomInputOptions,
+    metrics,
+)
+from livekit.plugins import deepgram, google, murf, noise_cancellation
+from livekit.plugins.turn_detector.multilingual import MultilingualModel
+
+from sentence_tokenizer import FastSentenceTokenizer
+from vad_singleton import get_vad
+
+logger = logging.getLogger("agent")
+
+_USAGE_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str)
+
+# Deepgram overrides for agents that capture prices, quantities or amounts
+# (grocery, fraud): wait 300ms instead of the plugin's 25ms default before
+# finalizing, and format numbers. This trades slower finalization for accuracy;
+# other agents keep the plugin defaults (nova-3, 25ms, interim results).
+STT_ACCURATE = {
+    "endpointing_ms": 300,
+    "smart_format": True,
+    "numerals": True,
+}
+
+
+# Shortest chunk sent to Murf, in characters (roughly six words). Tiny chunks made
+# per-request overhead dominate; longer ones amortize it over more audio.
+MIN_SENTENCE_LEN = 30
+
+
+async def _drain_metrics(
+    queue: asyncio.Queue, usage_collector: metrics.UsageCollector
+) -> None:
+    # Logs and aggregates metrics outside the session's event emitter. Errors are
+    # logged per item, as the emitter did for handlers, so one bad item doesn't
+    # stop metrics for the rest of the session.
+    while True:
+        collected = await queue.get()
+        try:
+            metrics.log_metrics(collected)
+            usage_collector.collect(collected)
+        except Exception:
+            logger.exception("Failed to process metrics")
+
+
+# before starting the agent, load the VAD (Voice Activity Detection) model into userdata.
+def prewarm(proc: JobProcess):
+    proc.userdata["vad"] = get_vad()
+
+
+def build_entrypoint(
+    agent_factory: Callable[[], Agent],
+    tools: list,
+    tts_voice: str = "en-US-matthew",
+    tts_style: Optional[str] = "Conversation",
+    stt_options: Optional[dict] = None,
+    use_turn_detector: bool = True,
+    shutdown_callbacks: Sequence[Callable[[], Awaitable[None]]] = (),
+):
+    """
+    Build a worker entrypoint that starts `agent_factory()` in a new AgentSession.
+
+    Args:
+        agent_factory: Callable returning the Agent for the session (usually the class).
+        tools: Function tools exposed to the LLM.
+        tts_voice: Murf voice id.
+        tts_style: Murf voice style, or None for the voice's default.
+        stt_options: Extra Deepgram STT kwargs, e.g. STT_ACCURATE.
+        use_turn_detector: Run the multilingual turn-detector model at the end of
+            each utterance; when False, turns end on VAD silence + STT endpointing.
+        shutdown_callbacks: Async callables run when the job shuts down, e.g. to
+            flush buffered tool writes before the process exits.
+    """
+
+    async def entrypoint(ctx: JobContext):
+        # Attach room name to logs
+        ctx.log_context_fields = {"room": ctx.room.name}
+        logger.info("Starting session for room: %s", ctx.room.name)
+
+        # Voice AI pipeline: Deepgram STT, Gemini LLM, Murf TTS
+        session = AgentSession(
+            stt=deepgram.STT(model="nova-3", **(stt_options or {})),
+            llm=google.LLM(model="gemini-2.5-flash"),
+            tts=murf.TTS(
+                voice=tts_voice,
+                style=tts_style,
+                tokenizer=FastSentenceTokenizer(min_sentence_len=MIN_SENTENCE_LEN),
+                text_pacing=True,
+            ),
+            turn_detection=MultilingualModel() if use_turn_detector else "vad",
+            vad=ctx.proc.userdata["vad"],
+            preemptive_generation=True,
+            tools=tools,
+        )
+
+        # Metrics collection: the handler only enqueues, so the emitter returns
+        # immediately and logging happens in a background task.
+        usage_collector = metrics.UsageCollector()
+        metrics_queue = asyncio.Queue()
+        metrics_task = asyncio.create_task(
+            _drain_metrics(metrics_queue, usage_collector)
+        )
+
+        @session.on("metrics_collected")
+        def _on_metrics_collected(ev: MetricsCollectedEvent):
+            metrics_queue.put_nowait(ev.metrics)
+
+        async def log_usage():
+            metrics_task.cancel()
+            while not metrics_queue.empty():
+                usage_collector.collect(metrics_queue.get_nowait())
+            # UsageSummary is a flat dataclass of counters: encode its __dict__
+            # once as a compact JSON line, and only if INFO is enabled.
+            if logger.isEnabledFor(logging.INFO):
+                summary = usage_collector.get_summary()
+                logger.info("Usage: %s", _USAGE_ENCODER.encode(vars(summary)))
+
+        ctx.add_shutdown_callback(log_usage)
+        for callback in shutdown_callbacks:
+            ctx.add_shutdown_callback(callback)
+
+        # Start the session (agent + room)
+        await session.start(
+            agent=agent_factory(),
+            room=ctx.room,
+            room_input_options=RoomInputOptions(
+                noise_cancellation=noise_cancellation.BVC(),
+            ),
+        )
+
+        # Join the room and connect to the user
+        await ctx.connect()
+        logger.info("Agent connected to room: %s", ctx.room.name)
+
+    return entrypoint
@@ -0,0 +1,86 @@
+"""
+sentence_tokenizer.py
+Regex sentence splitter for the TTS path. Replaces livekit's
+tokenize.basic.SentenceTokenizer, following its rules for abbreviations,
+dotted letter runs, decimals and ellipses, but finds sentence ends with one
+precompiled pattern instead of a dozen re.sub passes over the whole buffer,
+which the streaming tokenizer re-runs on every pushed LLM chunk.
+"""
+
+import functools
+import re
+from typing import Optional
+
+from livekit.agents.tokenize import (
+    BufferedSentenceStream,
+    SentenceStream,
+    SentenceTokenizer,
+)
+
+# Sentence-ending punctuation, optionally followed by closing quotes/brackets,
+# that is followed by whitespace or the end of the buffer. "3.5" or "quickbasket.in"
+# never match because the dot is followed by a non-space character.
+_SENTENCE_END_RE = re.compile(r"[.!?。！？]+[\"”')\]]*(?=\s|$)")  # noqa: RUF001
+# Words whose trailing dot does not end a sentence.
+_ABBREVIATIONS = frozenset(
+    {"mr", "mrs", "ms", "dr", "prof", "st", "jr", "sr", "vs", "etc"}
+)
+# Single letters and dotted letter runs ("B.", "p.m.", "U.S.", "e.g."), which
+# livekit's basic tokenizer never treats as a sentence end either.
+_LETTER_RUN_RE = re.compile(r"(?:[A-Za-z]\.)*[A-Za-z]")
+
+
+def split_sentences(
+    text: str, min_sentence_len: int = 20
+) -> list[tuple[str, int, int]]:
+    """
+    Split text into (sentence, start, end) tuples, `end` being an index into `text`.
+
+    Sentences no longer than `min_sentence_len` characters are merged into the
+    next one. Text after the last sentence end is returned as the final tuple.
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(text):
+        if match.group()[0] == ".":
+            # Walk back to the previous whitespace of any kind, so a word at
+            # the start of a line is not glued to the line before it.
+            word_start = match.start()
+            while word_start > start and not text[word_start - 1].isspace():
+                word_start -= 1
+            word = text[word_start : match.start()]
+            if word.lower() in _ABBREVIATIONS or _LETTER_RUN_RE.fullmatch(word):
+                continue
+
+        end = match.end()
+        sentence = text[start:end].replace("\n", " ").strip()
+        if len(sentence) > min_sentence_len:
+            sentences.append((sentence, start, end))
+            start = end
+
+    tail = text[start:].replace("\n", " ").strip()
+    if tail:
+        sentences.append((tail, start, len(text)))
+    return sentences
+
+
+class FastSentenceTokenizer(SentenceTokenizer):
+    def __init__(
+        self, *, min_sentence_len: int = 20, stream_context_len: int = 10
+    ) -> None:
+        self._min_sentence_len = min_sentence_len
+        self._stream_context_len = stream_context_len
+
+    def tokenize(self, text: str, *, language: Optional[str] = None) -> list[str]:
+        return [
+            sentence for sentence, _, _ in split_sentences(text, self._min_sentence_len)
+        ]
+
+    def stream(self, *, language: Optional[str] = None) -> SentenceStream:
+        return BufferedSentenceStream(
+            tokenizer=functools.partial(
+                split_sentences, min_sentence_len=self._min_sentence_len
+            ),
+            min_token_len=self._min_sentence_len,
+            min_ctx_len=self._stream_context_len,
+        )
@@ -0,0 +1,102 @@
+# src/tools/catalog_tools.py
+"""
+Grocery catalog and recipe lookups for the Day 7 ordering agent.
+
+The catalog and dish mappings live in catalog.json / recipes.json next to this
+file and are loaded once at import, so the agent's prompt no longer carries them
+on every turn; the LLM fetches only the rows it needs through these tools.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Optional
+
+from livekit.agents import RunContext, function_tool
+
+_DATA_DIR = Path(__file__).resolve().parent
+# Max number of catalog rows returned by one lookup.
+_TOP_K = 5
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _tokens(text: str) -> frozenset[str]:
+    """Lowercase word tokens with a naive plural strip ("eggs" -> "egg")."""
+    return frozenset(
+        word[:-1] if len(word) > 3 and word.endswith("s") else word
+        for word in _WORD_RE.findall(text.lower())
+    )
+
+
+with open(_DATA_DIR / "catalog.json", encoding="utf-8") as f:
+    CATALOG: list[dict[str, Any]] = json.load(f)
+
+with open(_DATA_DIR / "recipes.json", encoding="utf-8") as f:
+    RECIPES: dict[str, list[dict[str, Any]]] = json.load(f)
+
+_CATALOG_BY_NAME = {item["name"]: item for item in CATALOG}
+# Token set per catalog row, built from its name, category and tags.
+_ITEM_TOKENS = [
+    (_tokens(" ".join([item["name"], item["category"], *item["tags"]])), item)
+    for item in CATALOG
+]
+_RECIPE_TOKENS = [(_tokens(dish), dish) for dish in RECIPES]
+
+
+def _best_recipe(dish: str) -> Optional[str]:
+    query = _tokens(dish)
+    best, best_score = None, 0
+    for tokens, name in _RECIPE_TOKENS:
+        score = len(tokens & query)
+        if score > best_score:
+            best, best_score = name, score
+    return best
+
+
+@function_tool
+async def lookup_items(context: RunContext, query: str) -> str:
+    """
+    Search the store catalog for items matching a spoken request.
+
+    Args:
+        query: What the user asked for, e.g. "bread", "peanut butter", "snacks".
+
+    Returns:
+        A JSON list of up to 5 catalog items (name, category, price in INR, tags),
+        best match first. An empty list means the store doesn't stock it.
+    """
+    query_tokens = _tokens(query)
+    scored = [
+        (len(tokens & query_tokens), item)
+        for tokens, item in _ITEM_TOKENS
+        if not tokens.isdisjoint(query_tokens)
+    ]
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return _ENCODER.encode([item for _, item in scored[:_TOP_K]])
+
+
+@function_tool
+async def ingredients_for(context: RunContext, dish: str) -> str:
+    """
+    Get the catalog items needed for a simple dish.
+
+    Args:
+        dish: The dish the user wants to make, e.g. "peanut butter sandwich".
+
+    Returns:
+        A JSON object with the matched dish and its ingredients (catalog rows plus
+        optional "alternatives", "optional" and "note" hints), or an empty string
+        if the dish is unknown.
+    """
+    name = _best_recipe(dish)
+    if name is None:
+        return ""
+
+    ingredients = []
+    for entry in RECIPES[name]:
+        row = dict(_CATALOG_BY_NAME[entry["item"]])
+        row.update((key, value) for key, value in entry.items() if key != "item")
+        ingredients.append(row)
+    return _ENCODER.encode({"dish": name, "ingredients": ingredients})
@@ -0,0 +1,121 @@
+# src/tools/fraud_db.py
+
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from functools import lru_cache
+
+from livekit.agents import RunContext, function_tool
+
+logger = logging.getLogger(__name__)
+
+DB_FILE = "fraud_cases.db"
+
+FINAL_STATUSES = ("confirmed_safe", "confirmed_fraud", "verification_failed")
+
+_CASE_COLUMNS = (
+    "id, user_name, security_identifier, masked_card, amount, merchant, location, "
+    "timestamp, security_question, security_answer, status, outcome_note"
+)
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _normalize_name(user_name: str) -> str:
+    return user_name.strip().lower()
+
+
+@lru_cache(maxsize=256)
+def _pending_case_json(name_key: str) -> str:
+    """
+    Internal helper: the newest pending case for a normalized first name, as JSON.
+
+    Cached per name so repeated look-ups skip SQLite; update_fraud_case clears
+    the cache. Returns "{}" when there is no pending case.
+    """
+    with closing(sqlite3.connect(DB_FILE)) as conn:
+        row = conn.execute(
+            f"SELECT {_CASE_COLUMNS} FROM fraud_cases "
+            "WHERE lower(trim(user_name)) = ? AND status = 'pending_review' "
+            "ORDER BY id DESC LIMIT 1",
+            (name_key,),
+        ).fetchone()
+
+    if row is None:
+        return "{}"
+
+    return _ENCODER.encode(
+        {
+            "id": row[0],
+            "userName": row[1],
+            "securityIdentifier": row[2],
+            "maskedCard": row[3],
+            "amount": row[4],
+            "merchant": row[5],
+            "location": row[6],
+            "timestamp": row[7],
+            "securityQuestion": row[8],
+            "securityAnswer": row[9],
+            "status": row[10],
+            "outcomeNote": row[11],
+        }
+    )
+
+
+@function_tool
+async def load_fraud_case(context: RunContext, user_name: str) -> str:
+    """
+    Load the pending fraud case for a customer's first name.
+
+    Args:
+        user_name: The customer's first name (matched case-insensitively).
+
+    Returns:
+        The fraud case as a JSON string, or "{}" if there is no pending case.
+    """
+    try:
+        return _pending_case_json(_normalize_name(user_name))
+    except sqlite3.Error as e:
+        logger.error("Failed to load fraud case for %s: %s", user_name, e)
+        return "{}"
+
+
+@function_tool
+async def update_fraud_case(
+    context: RunContext,
+    case_id: int,
+    status: str,
+    outcome_note: str,
+) -> str:
+    """
+    Record the outcome of a fraud call.
+
+    Args:
+        case_id: The "id" of the fraud case returned by load_fraud_case.
+        status: One of "confirmed_safe", "confirmed_fraud", "verification_failed".
+        outcome_note: Short explanation of the outcome.
+
+    Returns:
+        A short confirmation message.
+    """
+    if status not in FINAL_STATUSES:
+        return f"Invalid status {status!r}; use one of: {', '.join(FINAL_STATUSES)}."
+
+    try:
+        with closing(sqlite3.connect(DB_FILE)) as conn, conn:
+            updated = conn.execute(
+                "UPDATE fraud_cases SET status = ?, outcome_note = ? WHERE id = ?",
+                (status, outcome_note, case_id),
+            ).rowcount
+    except sqlite3.Error as e:
+        logger.error("Failed to update fraud case %s: %s", case_id, e)
+        return "Failed to update the fraud case."
+
+    # The case is no longer pending, so cached look-ups are stale.
+    _pending_case_json.cache_clear()
+
+    if not updated:
+        return f"No fraud case found with id {case_id}."
+
+    logger.info("Updated fraud case %s to %s", case_id, status)
+    return "Fraud case updated."
@@ -1,23 +1,97 @@
 # src/tools/order_tools.py
+import asyncio
 import json
 import logging
+import os
 from livekit.agents import function_tool, RunContext
 
 logger = logging.getLogger(__name__)
 
+ORDERS_FILE = "orders.json"
+# Max number of queued orders flushed by one writev() call.
+_MAX_BATCH = 64
+_NEWLINE = b"\n"
+# Reused compact encoder; json.dumps() builds a new encoder whenever it gets options.
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+_fd = None
+_queue = None
+_writer_task = None
+
+
+async def _drain(queue: asyncio.Queue) -> None:
+    """
+    Background writer: flush queued orders to ORDERS_FILE off the event loop.
+
+    Each queued item is (payload, future); the future resolves once the batch
+    holding it has been written, so callers only report success after the
+    order is on disk. Every future in a batch is settled, whatever happens to
+    the write, so no caller is left waiting.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _MAX_BATCH and not queue.empty():
+            batch.append(queue.get_nowait())
+        # Reported to the batch if the task is cancelled mid-write.
+        error = RuntimeError("Order writer stopped")
+        try:
+            buffers = _with_newlines([payload for payload, _ in batch])
+            expected = sum(map(len, buffers))
+            written = await loop.run_in_executor(None, os.writev, _fd, buffers)
+            if written != expected:
+                raise OSError(f"Short write: {written} of {expected} bytes")
+            error = None
+        except Exception as e:
+            error = e
+        finally:
+            for _, done in batch:
+                if done.done():
+                    continue
+                if error is None:
+                    done.set_result(None)
+                else:
+                    done.set_exception(error)
+
+
+def _with_newlines(payloads: list) -> list:
+    """Interleave newline buffers so each order lands on its own line without concatenating."""
+    buffers = []
+    for payload in payloads:
+        buffers.append(payload)
+        buffers.append(_NEWLINE)
+    return buffers
+
+
+def _ensure_writer() -> asyncio.Queue:
+    """Open the orders file and start the writer task for the running loop."""
+    global _fd, _queue, _writer_task
+    if _fd is None:
+        _fd = os.open(ORDERS_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    loop = asyncio.get_running_loop()
+    if _writer_task is None or _writer_task.done() or _writer_task.get_loop() is not loop:
+        _queue = asyncio.Queue()
+        _writer_task = loop.create_task(_drain(_queue))
+    return _queue
+
+
 @function_tool
 async def save_order_to_json(context: RunContext, order: dict):
     """
     Save the final order to a JSON file.
     The LLM should call this tool only when all fields are filled.
-    
+
     Args:
         order: A dictionary containing order details.
     """
     try:
-        with open("orders.json", "a") as f:
-            f.write(json.dumps(order) + "\n")
+        payload = _ENCODER.encode(order).encode()
+        done = asyncio.get_running_loop().create_future()
+        _ensure_writer().put_nowait((payload, done))
+        # Concurrent saves are still batched into one writev(), but the tool
+        # only reports success once its order has been written.
+        await done
         return "Order saved successfully."
     except Exception as e:
-        logger.error(f"Error saving order: {e}")
+        logger.error("Error saving order: %s", e)
         return "Failed to save the order."
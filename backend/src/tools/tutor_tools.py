@@ -4,40 +4,139 @@ This file contains helper functions for loading and retrieving tutor content
 from the JSON file used in the Teach-the-Tutor voice agent (Day 4).
 """
 
+import functools
 import json
-import os
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+from types import MappingProxyType
 
-# Load content from JSON file
-def load_tutor_content():
+# backend/shared-data, resolved from this file rather than the working directory.
+TUTOR_CONTENT_FILE = (
+    Path(__file__).resolve().parents[2] / "shared-data" / "day4_tutor_content.json"
+)
+
+
+# Index key for a title: casefold() also matches titles that differ only in
+# non-ASCII case. Only the stored keys are interned (see _read_tutor_content);
+# queries are not, as interned strings are immortal on CPython 3.12+.
+def _title_key(title):
+    return title.casefold()
+
+
+# One concept from the content file; immutable, with attribute access.
+Concept = namedtuple("Concept", "id title summary sample_question")
+
+# Loaded tutor data. Every mapping is keyed by _title_key(title) except
+# `content`, the concepts in file order, and `aliases`, which maps each
+# singular/plural spelling of a key to the key. `matcher` finds the first
+# alias inside a free-form query.
+_TutorContent = namedtuple(
+    "_TutorContent", "content index summaries questions aliases matcher"
+)
+
+_EMPTY = _TutorContent(
+    (),
+    MappingProxyType({}),
+    MappingProxyType({}),
+    MappingProxyType({}),
+    MappingProxyType({}),
+    None,
+)
+
+
+def _aliases(keys):
+    # "loops" -> {"loops": "loops", "loop": "loops"}, "loop" -> the same pair.
+    aliases = {}
+    for key in keys:
+        aliases.setdefault(key, key)
+        aliases.setdefault(key[:-1] if key.endswith("s") else key + "s", key)
+    return aliases
+
+
+def _compile_matcher(aliases):
+    # One alternation, longest alias first so "for loops" wins over "loops".
+    if not aliases:
+        return None
+    alternatives = sorted(aliases, key=len, reverse=True)
+    pattern = "|".join(map(re.escape, alternatives))
+    return re.compile(rf"\b(?:{pattern})\b")
+
+
+# Parsed once per process; exceptions are not cached, so a failed read is retried.
+# Concepts are immutable, so a caller can't alter what later calls get.
+@functools.lru_cache(maxsize=1)
+def _read_tutor_content():
+    # One 64KB-buffered binary read and a single parse, instead of json.load
+    # pulling the file through a text-mode reader.
+    with open(TUTOR_CONTENT_FILE, "rb", buffering=65536) as f:
+        data = f.read()
+    content = tuple(
+        Concept(
+            id=item["id"],
+            title=item["title"],
+            summary=item["summary"],
+            sample_question=item["sample_question"],
+        )
+        for item in json.loads(data)
+    )
+    keys = [sys.intern(_title_key(concept.title)) for concept in content]
+    aliases = _aliases(keys)
+    return _TutorContent(
+        content=content,
+        index=MappingProxyType(dict(zip(keys, content))),
+        summaries=MappingProxyType(
+            {key: concept.summary for key, concept in zip(keys, content)}
+        ),
+        questions=MappingProxyType(
+            {key: concept.sample_question for key, concept in zip(keys, content)}
+        ),
+        aliases=MappingProxyType(aliases),
+        matcher=_compile_matcher(aliases),
+    )
+
+
+def _tutor_content():
     try:
-        file_path = os.path.join("shared-data", "day4_tutor_content.json")
-        with open(file_path, "r") as f:
-            content = json.load(f)
-        return content
+        return _read_tutor_content()
     except Exception as e:
         print(f"Error loading content: {e}")
-        return []
+        return _EMPTY
+
+
+# Load content from JSON file
+def load_tutor_content():
+    return _tutor_content().content
+
+
+def _lookup_key(data, title):
+    # Exact title first; otherwise the first known title (singular or plural)
+    # mentioned in the query, e.g. "python variable" -> "variables".
+    key = _title_key(title)
+    if key in data.index:
+        return key
+    match = data.matcher.search(key) if data.matcher else None
+    return data.aliases[match.group()] if match else None
 
 
-# Get concept by title (e.g., "variables", "loops")
-def get_concept_by_title(content, title):
-    for item in content:
-        if item["title"].lower() == title.lower():
-            return item
-    return None
+# Get concept by title (e.g., "variables", "loops", "explain a for loop")
+def get_concept_by_title(title):
+    data = _tutor_content()
+    return data.index.get(_lookup_key(data, title))
 
 
 # Get a concept summary for LEARN mode
-def get_summary(content, title):
-    concept = get_concept_by_title(content, title)
-    if concept:
-        return concept["summary"]
-    return "Sorry, I couldn't find that concept."
+def get_summary(title):
+    data = _tutor_content()
+    return data.summaries.get(
+        _lookup_key(data, title), "Sorry, I couldn't find that concept."
+    )
 
 
 # Get sample question for QUIZ or TEACH_BACK mode
-def get_sample_question(content, title):
-    concept = get_concept_by_title(content, title)
-    if concept:
-        return concept["sample_question"]
-    return "Sorry, no question found for that concept."
+def get_sample_question(title):
+    data = _tutor_content()
+    return data.questions.get(
+        _lookup_key(data, title), "Sorry, no question found for that concept."
+    )
@@ -1,43 +1,137 @@
 # src/tools/wellness_tools.py
 
+import asyncio
 import json
 import logging
+import mmap
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict, List
 
 from livekit.agents import function_tool, RunContext
 
 logger = logging.getLogger(__name__)
 
-LOG_FILE = "wellness_log.json"
+# Resolved once at import: backend/wellness_log.jsonl unless WELLNESS_LOG is set,
+# so the log no longer depends on the directory the agent was started from.
+LOG_FILE = Path(
+    os.environ.get(
+        "WELLNESS_LOG",
+        Path(__file__).resolve().parents[2] / "wellness_log.jsonl",
+    )
+).resolve()
+if LOG_FILE.suffix == ".json":
+    # A .json path is the old array log: appending JSONL lines to it would
+    # corrupt it, so migrate it to a .jsonl file next to it and log there.
+    logger.warning(
+        "WELLNESS_LOG points at a JSON array log (%s); using %s",
+        LOG_FILE,
+        LOG_FILE.with_suffix(".jsonl"),
+    )
+    LOG_FILE = LOG_FILE.with_suffix(".jsonl")
+# Pre-JSONL log (a single JSON array), converted by migrate_legacy_log().
+LEGACY_LOG_FILE = LOG_FILE.with_suffix(".json")
+
+# Module-level encoder: json.dumps(..., separators=...) would construct one per call.
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# Seconds a check-in stays buffered so a burst of entries is appended in one write.
+_FLUSH_DELAY = 2.0
+
+_migrated = False
+# Encoded lines not yet appended to LOG_FILE, oldest first.
+_pending: List[bytes] = []
+_pending_lock = threading.Lock()
+_flush_handle = None
+_flush_loop = None
+
+
+def migrate_legacy_log() -> None:
+    """
+    Convert the old wellness_log.json (one JSON array) next to LOG_FILE to JSONL
+    (one entry per line). Does nothing if the JSONL log already exists or there is no old log.
+    """
+    global _migrated
+    _migrated = True
+    if LOG_FILE.exists():
+        return
 
+    try:
+        with open(LEGACY_LOG_FILE, "rb") as f:
+            entries = json.loads(f.read())
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        logger.error("Failed to read %s: %s", LEGACY_LOG_FILE, e)
+        return
 
-def _load_all_entries() -> List[Dict[str, Any]]:
-    """Internal helper: load all entries from wellness_log.json."""
-    if not os.path.exists(LOG_FILE):
-        return []
+    if not isinstance(entries, list):
+        logger.warning("Unexpected JSON structure in %s, not migrating", LEGACY_LOG_FILE)
+        return
 
     try:
-        with open(LOG_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-            else:
-                logger.warning("Unexpected JSON structure in wellness_log.json, resetting to []")
-                return []
+        # Written next to the log and renamed into place, so an interrupted
+        # migration never leaves a partial JSONL file that would block a retry.
+        tmp_file = LOG_FILE.with_name(LOG_FILE.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.writelines(_encode_line(entry) for entry in entries)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, LOG_FILE)
+        logger.info("Migrated %d entries from %s to %s", len(entries), LEGACY_LOG_FILE, LOG_FILE)
     except Exception as e:
-        logger.error(f"Failed to read {LOG_FILE}: {e}")
-        return []
+        logger.error("Failed to migrate %s: %s", LEGACY_LOG_FILE, e)
+
+
+def _encode_line(entry: Dict[str, Any]) -> bytes:
+    return _COMPACT_ENCODER.encode(entry).encode("utf-8") + b"\n"
 
 
-def _save_all_entries(entries: List[Dict[str, Any]]) -> None:
-    """Internal helper: save all entries to wellness_log.json."""
+def _flush() -> None:
+    """Append all buffered entries to the log with a single write."""
+    global _flush_handle
+    with _pending_lock:
+        _flush_handle = None
+        if not _pending:
+            return
+        try:
+            with open(LOG_FILE, "ab") as f:
+                f.write(b"".join(_pending))
+        except Exception as e:
+            logger.error("Failed to write %s: %s", LOG_FILE, e)
+        _pending.clear()
+
+
+async def flush_wellness_log() -> None:
+    """
+    Job shutdown callback: append any buffered entries now.
+
+    Job processes exit with os._exit(), so neither atexit hooks nor a pending
+    call_later timer can be relied on once the job has ended.
+    """
+    _flush()
+
+
+def _read_last_line() -> bytes:
+    """Internal helper: the last non-empty line of the log, read from the end of the file."""
+    if not _migrated:
+        migrate_legacy_log()
     try:
-        with open(LOG_FILE, "w", encoding="utf-8") as f:
-            json.dump(entries, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        logger.error(f"Failed to write {LOG_FILE}: {e}")
+        with open(LOG_FILE, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            # Map the file and search backwards from the end: only the pages
+            # holding the last line are read, however long the log or the line is.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                while end and mm[end - 1 : end] == b"\n":
+                    end -= 1
+                start = mm.rfind(b"\n", 0, end) + 1
+                return mm[start:end]
+    except FileNotFoundError:
+        return b""
 
 
 @function_tool
@@ -47,13 +141,24 @@ async def get_last_wellness_entry(context: RunContext) -> str:
     If no data exists, return an empty string.
     The LLM should parse or summarize this text and reference it gently.
     """
-    entries = _load_all_entries()
-    if not entries:
+    with _pending_lock:
+        if _pending:
+            return _pending[-1].rstrip(b"\n").decode("utf-8")
+
+    try:
+        line = _read_last_line()
+    except Exception as e:
+        logger.error("Failed to read %s: %s", LOG_FILE, e)
         return ""
 
-    last = entries[-1]
-    # Return a compact JSON string the LLM can read.
-    return json.dumps(last, ensure_ascii=False)
+    if not line:
+        return ""
+    if not line.startswith(b"{"):
+        logger.warning("Unexpected last line in %s, ignoring it", LOG_FILE)
+        return ""
+
+    # Lines are already compact JSON written by _encode_line; return as-is.
+    return line.decode("utf-8")
 
 
 @function_tool
@@ -66,7 +171,7 @@ async def log_wellness_entry(
     summary: str,
 ) -> str:
     """
-    Store a new wellness check-in entry in wellness_log.json.
+    Store a new wellness check-in entry in wellness_log.jsonl.
 
     Args:
         mood: Short text describing current mood (e.g. "anxious but hopeful").
@@ -78,8 +183,11 @@ async def log_wellness_entry(
     Returns:
         A short confirmation message.
     """
+    global _flush_handle, _flush_loop
     entry = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": datetime.now(timezone.utc)
+        .isoformat(timespec="milliseconds")
+        .replace("+00:00", "Z"),
         "mood": mood,
         "energy": energy,
         "stressors": stressors,
@@ -87,9 +195,17 @@ async def log_wellness_entry(
         "summary": summary,
     }
 
-    entries = _load_all_entries()
-    entries.append(entry)
-    _save_all_entries(entries)
-
-    logger.info(f"Saved wellness entry: {entry}")
+    if not _migrated:
+        migrate_legacy_log()
+    # Append-only: entries are buffered and flushed as new lines after
+    # _FLUSH_DELAY, or by flush_wellness_log when the job shuts down.
+    with _pending_lock:
+        _pending.append(_encode_line(entry))
+        loop = asyncio.get_running_loop()
+        # A timer left on a previous job's (closed) loop would never fire.
+        if _flush_handle is None or _flush_loop is not loop:
+            _flush_loop = loop
+            _flush_handle = loop.call_later(_FLUSH_DELAY, _flush)
+
+    logger.info("Saved wellness entry: %s", entry)
     return "Wellness entry saved."
@@ -0,0 +1,34 @@
+"""
+vad_singleton.py
+Process-wide Silero VAD shared by every agent's prewarm, so the ONNX model is
+deserialized once per worker process instead of once per prewarm call.
+"""
+
+import os
+import threading
+
+from livekit.plugins import silero
+
+_VAD = None
+_VAD_LOCK = threading.Lock()
+
+
+def get_vad() -> silero.VAD:
+    """
+    Return the shared Silero VAD, loading it on first use.
+
+    Set SILERO_VAD_ONNX to load a different export of the model, e.g. an
+    INT8-quantized one. The plugin already runs it on the CPU provider with a
+    single intra-op thread and spinning disabled, so it does not compete with
+    the event loop for cores.
+    """
+    global _VAD
+    if _VAD is None:
+        with _VAD_LOCK:
+            if _VAD is None:
+                model_path = os.environ.get("SILERO_VAD_ONNX")
+                if model_path:
+                    _VAD = silero.VAD.load(onnx_file_path=model_path)
+                else:
+                    _VAD = silero.VAD.load()
+    return _VAD
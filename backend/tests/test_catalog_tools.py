@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from tools.catalog_tools import ingredients_for, lookup_items
+
+
+async def _names(query: str) -> list:
+    return [item["name"] for item in json.loads(await lookup_items(None, query))]
+
+
+@pytest.mark.asyncio
+async def test_lookup_strips_plurals() -> None:
+    assert await _names("eggs") == ["eggs (6 pack)"]
+    assert await _names("egg") == ["eggs (6 pack)"]
+
+
+@pytest.mark.asyncio
+async def test_lookup_matches_category() -> None:
+    assert sorted(await _names("snacks")) == ["chocolate cookies", "potato chips"]
+
+
+@pytest.mark.asyncio
+async def test_lookup_ranks_best_match_first() -> None:
+    names = await _names("peanut butter")
+
+    assert names[0] == "peanut butter"
+
+
+@pytest.mark.asyncio
+async def test_lookup_unknown_item_returns_empty_list() -> None:
+    assert await lookup_items(None, "sushi") == "[]"
+
+
+@pytest.mark.asyncio
+async def test_ingredients_for_matches_dish_in_a_phrase() -> None:
+    result = json.loads(await ingredients_for(None, "pasta for two people"))
+
+    assert result["dish"] == "pasta"
+    names = [item["name"] for item in result["ingredients"]]
+    assert "pasta 500g" in names
+    assert all("price" in item for item in result["ingredients"])
+
+
+@pytest.mark.asyncio
+async def test_ingredients_for_unknown_dish_returns_empty_string() -> None:
+    assert await ingredients_for(None, "biryani") == ""
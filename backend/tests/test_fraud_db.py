@@ -0,0 +1,108 @@
+import json
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from tools import fraud_db
+
+SCHEMA = """
+CREATE TABLE fraud_cases (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_name TEXT NOT NULL,
+    security_identifier TEXT NOT NULL,
+    masked_card TEXT NOT NULL,
+    amount REAL NOT NULL,
+    merchant TEXT NOT NULL,
+    location TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    security_question TEXT NOT NULL,
+    security_answer TEXT NOT NULL,
+    status TEXT NOT NULL,
+    outcome_note TEXT
+)
+"""
+
+
+def _case(user_name: str, status: str = "pending_review") -> tuple:
+    return (
+        user_name,
+        "12345",
+        "**** 4242",
+        499.0,
+        "ABC Electronics",
+        "Mumbai",
+        "2025-11-28T10:00:00Z",
+        "What is your favourite colour?",
+        "blue",
+        status,
+        None,
+    )
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """A temporary fraud_cases.db with a resolved case and a pending one."""
+    path = tmp_path / "fraud_cases.db"
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute(SCHEMA)
+        conn.executemany(
+            "INSERT INTO fraud_cases (user_name, security_identifier, masked_card, "
+            "amount, merchant, location, timestamp, security_question, "
+            "security_answer, status, outcome_note) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [_case(" Alice", "confirmed_safe"), _case(" Alice")],
+        )
+    monkeypatch.setattr(fraud_db, "DB_FILE", str(path))
+    fraud_db._pending_case_json.cache_clear()
+    yield path
+    fraud_db._pending_case_json.cache_clear()
+
+
+def _status(path, case_id: int) -> str:
+    with closing(sqlite3.connect(path)) as conn:
+        return conn.execute(
+            "SELECT status FROM fraud_cases WHERE id = ?", (case_id,)
+        ).fetchone()[0]
+
+
+@pytest.mark.asyncio
+async def test_lookup_ignores_case_and_surrounding_whitespace(db) -> None:
+    case = json.loads(await fraud_db.load_fraud_case(None, "  ALICE "))
+
+    assert case["id"] == 2
+    assert case["status"] == "pending_review"
+    assert case["maskedCard"] == "**** 4242"
+
+
+@pytest.mark.asyncio
+async def test_lookup_without_pending_case_returns_empty_object(db) -> None:
+    assert await fraud_db.load_fraud_case(None, "Bob") == "{}"
+
+
+@pytest.mark.asyncio
+async def test_update_rejects_unknown_status(db) -> None:
+    result = await fraud_db.update_fraud_case(None, 2, "resolved", "n/a")
+
+    assert result.startswith("Invalid status")
+    assert _status(db, 2) == "pending_review"
+
+
+@pytest.mark.asyncio
+async def test_update_unknown_id(db) -> None:
+    result = await fraud_db.update_fraud_case(None, 999, "confirmed_safe", "n/a")
+
+    assert result == "No fraud case found with id 999."
+
+
+@pytest.mark.asyncio
+async def test_update_clears_cached_lookup(db) -> None:
+    assert json.loads(await fraud_db.load_fraud_case(None, "alice"))["id"] == 2
+
+    result = await fraud_db.update_fraud_case(
+        None, 2, "confirmed_fraud", "Customer did not make this purchase."
+    )
+
+    assert result == "Fraud case updated."
+    assert _status(db, 2) == "confirmed_fraud"
+    assert await fraud_db.load_fraud_case(None, "alice") == "{}"
@@ -0,0 +1,76 @@
+import pytest
+from livekit.agents.tokenize import basic
+
+from sentence_tokenizer import FastSentenceTokenizer, split_sentences
+
+CASES = [
+    # Abbreviations
+    "Please see Dr. Smith about your order. He is waiting for you at the counter.",
+    "Mr. and Mrs. Rao ordered eggs, e.g. brown ones. They want delivery tomorrow.",
+    # Decimals
+    "The total comes to 3.5 kilograms of rice today. Anything else for you?",
+    # Ellipses
+    "Wait... I think I forgot something important here. Let me check my list.",
+    # Short sentences merged into the next one
+    "Hi. Ok. Your order of bread and milk has been placed successfully.",
+    # Abbreviation at the start of a line
+    "Hi.\nDr. Smith will call you back later today. Thanks for waiting so long.",
+    # Dotted letter runs and single letters
+    "We noticed a charge at ABC Industries at 2:32 p.m. in Mumbai, using your "
+    "card ending 4242. Was this you?",
+    "Your groceries will arrive at 10 a.m. to the address on file. Anything else?",
+    "We ship across the U.S. and India within a week. Want express delivery?",
+    "Please choose plan B. It is cheaper and arrives earlier than the other plan.",
+]
+
+
+# 30 is agent_runtime.MIN_SENTENCE_LEN, the length used in production.
+@pytest.mark.parametrize("min_sentence_len", [20, 30])
+@pytest.mark.parametrize("text", CASES)
+def test_tokenize_matches_basic_tokenizer(text: str, min_sentence_len: int) -> None:
+    expected = basic.SentenceTokenizer(min_sentence_len=min_sentence_len).tokenize(text)
+
+    tokenizer = FastSentenceTokenizer(min_sentence_len=min_sentence_len)
+    assert tokenizer.tokenize(text) == expected
+
+
+def test_time_of_day_stays_in_one_sentence() -> None:
+    sentences = FastSentenceTokenizer(min_sentence_len=30).tokenize(CASES[6])
+
+    assert sentences[0].endswith("using your card ending 4242.")
+
+
+def test_abbreviation_after_newline_does_not_split() -> None:
+    sentences = FastSentenceTokenizer(min_sentence_len=1).tokenize(
+        "Hi.\nDr. Smith is here."
+    )
+
+    assert sentences == ["Hi.", "Dr. Smith is here."]
+
+
+def test_split_sentences_reports_offsets() -> None:
+    text = "Your order has been placed. It arrives in twenty minutes"
+
+    assert split_sentences(text) == [
+        ("Your order has been placed.", 0, 27),
+        ("It arrives in twenty minutes", 27, len(text)),
+    ]
+
+
+async def _stream_tokens(tokenizer, text: str, chunk_size: int = 7) -> list:
+    stream = tokenizer.stream()
+    for i in range(0, len(text), chunk_size):
+        stream.push_text(text[i : i + chunk_size])
+    stream.end_input()
+    return [event.token async for event in stream]
+
+
+@pytest.mark.asyncio
+async def test_stream_matches_basic_tokenizer() -> None:
+    text = " ".join(CASES[:4])
+    expected = await _stream_tokens(basic.SentenceTokenizer(min_sentence_len=20), text)
+
+    assert (
+        await _stream_tokens(FastSentenceTokenizer(min_sentence_len=20), text)
+        == expected
+    )
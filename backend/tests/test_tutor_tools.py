@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from tools import tutor_tools
+
+CONTENT = [
+    {
+        "id": "variables",
+        "title": "Variables",
+        "summary": "Variables store values.",
+        "sample_question": "What is a variable?",
+    },
+    {
+        "id": "loops",
+        "title": "Loops",
+        "summary": "Loops repeat code.",
+        "sample_question": "When would you use a loop?",
+    },
+    {
+        "id": "for_loops",
+        "title": "For Loops",
+        "summary": "A for loop iterates over a sequence.",
+        "sample_question": "What does range() give a for loop?",
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def content_file(tmp_path, monkeypatch):
+    path = tmp_path / "day4_tutor_content.json"
+    path.write_text(json.dumps(CONTENT), encoding="utf-8")
+    monkeypatch.setattr(tutor_tools, "TUTOR_CONTENT_FILE", path)
+    tutor_tools._read_tutor_content.cache_clear()
+    yield path
+    tutor_tools._read_tutor_content.cache_clear()
+
+
+def test_exact_title_is_case_insensitive() -> None:
+    assert tutor_tools.get_concept_by_title("LOOPS").id == "loops"
+    assert (
+        tutor_tools.get_summary("for loops") == "A for loop iterates over a sequence."
+    )
+
+
+def test_singular_and_plural_titles_match() -> None:
+    assert tutor_tools.get_concept_by_title("loop").id == "loops"
+    assert tutor_tools.get_sample_question("variable") == "What is a variable?"
+
+
+def test_title_inside_a_phrase_prefers_longest_match() -> None:
+    assert tutor_tools.get_concept_by_title("explain for loops").title == "For Loops"
+    assert tutor_tools.get_concept_by_title("python variables").id == "variables"
+
+
+def test_unknown_title_falls_back() -> None:
+    assert tutor_tools.get_concept_by_title("recursion") is None
+    assert (
+        tutor_tools.get_summary("recursion") == "Sorry, I couldn't find that concept."
+    )
+    assert (
+        tutor_tools.get_sample_question("recursion")
+        == "Sorry, no question found for that concept."
+    )
+
+
+def test_unlisted_loop_kind_matches_generic_title() -> None:
+    # Matching is by known title words, so an unknown kind of loop falls back
+    # to the generic "Loops" concept rather than to nothing.
+    assert tutor_tools.get_concept_by_title("while loops").title == "Loops"
+
+
+def test_missing_content_file_falls_back(content_file) -> None:
+    content_file.unlink()
+    tutor_tools._read_tutor_content.cache_clear()
+
+    assert tutor_tools.load_tutor_content() == ()
+    assert tutor_tools.get_summary("loops") == "Sorry, I couldn't find that concept."
@@ -0,0 +1,89 @@
+import importlib
+import json
+
+import pytest
+
+from tools import wellness_tools
+
+
+@pytest.fixture
+def wellness(tmp_path, monkeypatch):
+    """wellness_tools reloaded with its log in tmp_path."""
+    monkeypatch.setenv("WELLNESS_LOG", str(tmp_path / "wellness_log.jsonl"))
+    return importlib.reload(wellness_tools)
+
+
+def _write_legacy(module, data) -> None:
+    module.LEGACY_LOG_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def test_migrates_legacy_array(wellness) -> None:
+    entries = [{"mood": "good"}, {"mood": "tired", "objectives": ["sleep"]}]
+    _write_legacy(wellness, entries)
+
+    wellness.migrate_legacy_log()
+
+    lines = wellness.LOG_FILE.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == entries
+    assert not wellness.LOG_FILE.with_name(wellness.LOG_FILE.name + ".tmp").exists()
+
+
+def test_migration_is_a_no_op_when_jsonl_exists(wellness) -> None:
+    _write_legacy(wellness, [{"mood": "old"}])
+    wellness.LOG_FILE.write_bytes(b'{"mood":"new"}\n')
+
+    wellness.migrate_legacy_log()
+
+    assert wellness.LOG_FILE.read_bytes() == b'{"mood":"new"}\n'
+
+
+def test_migration_skips_legacy_file_that_is_not_a_list(wellness) -> None:
+    _write_legacy(wellness, {"mood": "good"})
+
+    wellness.migrate_legacy_log()
+
+    assert not wellness.LOG_FILE.exists()
+
+
+def test_json_path_in_env_is_treated_as_legacy_log(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("WELLNESS_LOG", str(tmp_path / "wellness_log.json"))
+    module = importlib.reload(wellness_tools)
+
+    assert module.LOG_FILE.name == "wellness_log.jsonl"
+    assert module.LEGACY_LOG_FILE.name == "wellness_log.json"
+    assert module.LOG_FILE.parent == module.LEGACY_LOG_FILE.parent
+
+
+@pytest.mark.asyncio
+async def test_missing_and_empty_log_have_no_last_entry(wellness) -> None:
+    assert await wellness.get_last_wellness_entry(None) == ""
+
+    wellness.LOG_FILE.write_bytes(b"")
+    assert await wellness.get_last_wellness_entry(None) == ""
+
+
+@pytest.mark.asyncio
+async def test_last_entry_ignores_trailing_blank_lines(wellness) -> None:
+    wellness.LOG_FILE.write_bytes(b'{"mood":"first"}\n{"mood":"last"}\n\n\n')
+
+    assert await wellness.get_last_wellness_entry(None) == '{"mood":"last"}'
+
+
+@pytest.mark.asyncio
+async def test_reads_back_entry_after_append(wellness) -> None:
+    wellness.LOG_FILE.write_bytes(b'{"mood":"earlier"}\n')
+
+    await wellness.log_wellness_entry(
+        None, "calm", "high", "none", ["walk"], "Feeling calm."
+    )
+    # Visible while still buffered...
+    buffered = json.loads(await wellness.get_last_wellness_entry(None))
+    assert buffered["mood"] == "calm"
+
+    # ...and from the file once the shutdown flush has run.
+    await wellness.flush_wellness_log()
+    assert wellness._pending == []
+    lines = wellness.LOG_FILE.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(await wellness.get_last_wellness_entry(None)) == buffered
+    assert buffered["timestamp"].endswith("Z")